@@ -7,7 +7,7 @@ Customize files in src/ for your task.
 
 from .base_generator import BaseGenerator, GenerationConfig
 from .schemas import TaskPair
-from .image_utils import ImageRenderer
+from .image_utils import ImageRenderer, ImagePool
 from .output_writer import OutputWriter
 from .video_utils import VideoGenerator
 
@@ -16,6 +16,7 @@ __all__ = [
     "GenerationConfig",
     "TaskPair",
     "ImageRenderer",
+    "ImagePool",
     "OutputWriter",
     "VideoGenerator",
 ]
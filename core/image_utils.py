@@ -38,3 +38,30 @@ class ImageRenderer:
     def ensure_rgb(image: Image.Image) -> Image.Image:
         """Convert image to RGB."""
         return image.convert('RGB') if image.mode != 'RGB' else image
+
+
+class ImagePool:
+    """
+    Pool of reusable image canvases.
+
+    Frame-by-frame rendering allocates and discards a full canvas per
+    frame; the pool hands previously released canvases back out (cleared
+    to the background color) instead of allocating fresh ones.
+    """
+
+    def __init__(self):
+        self._free = {}
+
+    def acquire(self, size: Tuple[int, int], bg_color: Tuple[int, int, int] = (255, 255, 255), mode: str = 'RGB') -> Image.Image:
+        """Get a cleared canvas, reusing a released one when available."""
+        free = self._free.get((size, mode))
+        if free:
+            img = free.pop()
+            draw = ImageDraw.Draw(img)
+            draw.rectangle([0, 0, size[0], size[1]], fill=bg_color)
+            return img
+        return Image.new(mode, size, bg_color)
+
+    def release(self, img: Image.Image) -> None:
+        """Return a canvas to the pool for reuse."""
+        self._free.setdefault((img.size, img.mode), []).append(img)
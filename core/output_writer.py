@@ -1,6 +1,13 @@
 """Output writer for standard format."""
 
+import io
+import json
+import mmap
+import os
 import shutil
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 from .schemas import TaskPair
@@ -9,35 +16,248 @@ from .image_utils import ImageRenderer
 
 class OutputWriter:
     """Writes tasks to standard folder structure."""
-    
-    def __init__(self, output_dir: Path):
+
+    def __init__(
+        self,
+        output_dir: Path,
+        num_io_workers: int = 8,
+        use_shards: bool = False,
+        shard_size: int = 1000,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.num_io_workers = max(1, num_io_workers)
+        self.use_shards = use_shards
+        self.shard_size = max(1, shard_size)
+
+        # Directory fds for dir_fd-relative opens: the parent directory is
+        # resolved through the VFS once instead of per file per task
+        self._dir_fds = {}
+        self._dir_fd_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close cached directory descriptors."""
+        with self._dir_fd_lock:
+            for fd in self._dir_fds.values():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._dir_fds.clear()
+
+    def __del__(self):
+        self.close()
+
+    def _parent_dir_fd(self, parent: Path) -> int:
+        """Get an O_DIRECTORY fd for `parent`, creating/opening it once."""
+        key = str(parent)
+        fd = self._dir_fds.get(key)
+        if fd is None:
+            with self._dir_fd_lock:
+                fd = self._dir_fds.get(key)
+                if fd is None:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    fd = os.open(key, os.O_RDONLY | os.O_DIRECTORY)
+                    self._dir_fds[key] = fd
+        return fd
     
     def write_task_pair(self, task_pair: TaskPair) -> Path:
         """Write single task to disk."""
         task_dir = self.output_dir / f"{task_pair.domain}_task" / task_pair.task_id
-        task_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Write images
-        ImageRenderer.ensure_rgb(task_pair.first_image).save(task_dir / "first_frame.png")
-        
+
+        # All opens go through one cached parent-directory fd, so only the
+        # final path component is resolved per file
+        dir_fd = self._parent_dir_fd(task_dir.parent)
+        task_id = task_pair.task_id
+        try:
+            os.mkdir(task_id, dir_fd=dir_fd)
+        except FileExistsError:
+            pass
+
+        def _open(filename: str):
+            fd = os.open(
+                f"{task_id}/{filename}",
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644,
+                dir_fd=dir_fd,
+            )
+            return os.fdopen(fd, "wb")
+
+        # Write images (compress_level=1: zlib level 6 is CPU-heavy and the
+        # extra compression is negligible for these flat synthetic images)
+        with _open("first_frame.png") as f:
+            ImageRenderer.ensure_rgb(task_pair.first_image).save(
+                f, format="PNG", compress_level=1, optimize=False)
+
         if task_pair.final_image:
-            ImageRenderer.ensure_rgb(task_pair.final_image).save(task_dir / "final_frame.png")
-        
+            with _open("final_frame.png") as f:
+                ImageRenderer.ensure_rgb(task_pair.final_image).save(
+                    f, format="PNG", compress_level=1, optimize=False)
+
         # Write prompt
-        (task_dir / "prompt.txt").write_text(task_pair.prompt)
-        
+        with _open("prompt.txt") as f:
+            f.write(task_pair.prompt.encode("utf-8"))
+
         # Write video if provided (preserve original extension)
         if task_pair.ground_truth_video and Path(task_pair.ground_truth_video).exists():
             video_src = Path(task_pair.ground_truth_video)
             video_ext = video_src.suffix  # .mp4 or .avi
-            shutil.copy(video_src, task_dir / f"ground_truth{video_ext}")
-        
+            with open(video_src, "rb") as src, _open(f"ground_truth{video_ext}") as dst:
+                shutil.copyfileobj(src, dst)
+
         return task_dir
     
     def write_dataset(self, task_pairs: List[TaskPair]) -> Path:
-        """Write all tasks to disk."""
+        """
+        Write all tasks to disk.
+
+        Per-task writes are independent small files, so they are batched
+        onto a thread pool to overlap I/O latency instead of paying each
+        synchronous write() round-trip serially.
+        """
+        self._write_prompt_aggregate(task_pairs)
+
+        if self.use_shards:
+            return self._write_sharded(task_pairs)
+
+        if self.num_io_workers == 1 or len(task_pairs) <= 1:
+            for pair in task_pairs:
+                self.write_task_pair(pair)
+            return self.output_dir
+
+        workers = min(self.num_io_workers, len(task_pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results so any write error propagates to the caller
+            list(executor.map(self.write_task_pair, task_pairs))
+        return self.output_dir
+
+    def _write_prompt_aggregate(self, task_pairs: List[TaskPair]) -> None:
+        """
+        Write every prompt into one dataset.prompts.txt in a single call.
+
+        Prompts are accumulated in memory and flushed with one buffered
+        write (no per-file fsync), letting the kernel coalesce the I/O
+        instead of paying a syscall round-trip per task.
+        """
+        if not task_pairs:
+            return
+        buf = bytearray()
         for pair in task_pairs:
-            self.write_task_pair(pair)
+            buf += b"----TASK %s----\n" % pair.task_id.encode("utf-8")
+            buf += pair.prompt.encode("utf-8")
+            buf += b"\n"
+        (self.output_dir / "dataset.prompts.txt").write_bytes(buf)
+
+    # ──────────────────────────────────────────────────────────────────────
+    #  Sharded output (use_shards=True)
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _task_pair_records(self, task_pair: TaskPair) -> List[tuple]:
+        """Serialize a task pair to (filename, bytes) records in memory."""
+        records = []
+
+        buf = io.BytesIO()
+        ImageRenderer.ensure_rgb(task_pair.first_image).save(
+            buf, format="PNG", compress_level=1, optimize=False)
+        records.append(("first_frame.png", buf.getvalue()))
+
+        if task_pair.final_image:
+            buf = io.BytesIO()
+            ImageRenderer.ensure_rgb(task_pair.final_image).save(
+                buf, format="PNG", compress_level=1, optimize=False)
+            records.append(("final_frame.png", buf.getvalue()))
+
+        records.append(("prompt.txt", task_pair.prompt.encode("utf-8")))
+
+        if task_pair.ground_truth_video and Path(task_pair.ground_truth_video).exists():
+            video_src = Path(task_pair.ground_truth_video)
+            records.append((f"ground_truth{video_src.suffix}", video_src.read_bytes()))
+
+        return records
+
+    def _write_sharded(self, task_pairs: List[TaskPair]) -> Path:
+        """
+        Write tasks as aggregated shard archives instead of one directory
+        (4+ files, 4+ inodes) per task.
+
+        Emits `shard_XXXX.tar` files of up to `shard_size` tasks plus a
+        `manifest.json` mapping task_id -> {shard, files: {name: (offset,
+        size)}}, so consumers can mmap a shard and slice members directly
+        without unpacking.
+        """
+        shard_dir = self.output_dir / f"{task_pairs[0].domain}_task" if task_pairs else self.output_dir
+        shard_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = {}
+        for shard_idx in range(0, len(task_pairs), self.shard_size):
+            shard_name = f"shard_{shard_idx // self.shard_size:04d}.tar"
+            shard_path = shard_dir / shard_name
+
+            # Assemble the whole shard in memory, then flush it with one
+            # large (O_DIRECT when possible) write
+            blob = io.BytesIO()
+            with tarfile.open(fileobj=blob, mode="w") as tar:
+                for pair in task_pairs[shard_idx:shard_idx + self.shard_size]:
+                    for filename, data in self._task_pair_records(pair):
+                        info = tarfile.TarInfo(name=f"{pair.task_id}/{filename}")
+                        info.size = len(data)
+                        tar.addfile(info, io.BytesIO(data))
+                    manifest[pair.task_id] = {"shard": shard_name, "files": {}}
+
+            self._write_blob(shard_path, blob.getbuffer())
+
+            # Member data offsets are only resolved on read, so re-scan the
+            # finished shard once to record them in the manifest
+            blob.seek(0)
+            with tarfile.open(fileobj=blob, mode="r") as tar:
+                for info in tar.getmembers():
+                    task_id, filename = info.name.split("/", 1)
+                    manifest[task_id]["files"][filename] = [info.offset_data, info.size]
+
+        (shard_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
         return self.output_dir
+
+    @staticmethod
+    def _write_blob(path: Path, data) -> None:
+        """
+        Write a finished blob to disk in one call.
+
+        On Linux filesystems that support it, the blob goes out through
+        O_DIRECT from a page-aligned buffer padded to a 4 KiB multiple,
+        bypassing the page cache for these write-once archives; the file
+        is truncated back to the real length afterwards. Falls back to a
+        plain buffered write when O_DIRECT is unavailable or rejected
+        (e.g. tmpfs, NFS).
+        """
+        data = memoryview(data)
+        if hasattr(os, "O_DIRECT") and len(data) > 0:
+            try:
+                fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+            except OSError:
+                fd = -1
+            if fd >= 0:
+                aligned_len = -(-len(data) // mmap.PAGESIZE) * mmap.PAGESIZE
+                buf = mmap.mmap(-1, aligned_len)
+                view = memoryview(buf)
+                try:
+                    buf[:len(data)] = data
+                    # os.write may return short; keep writing until the
+                    # whole aligned buffer is out, or give up and let the
+                    # buffered path rewrite the file from scratch
+                    written = 0
+                    while written < aligned_len:
+                        n = os.write(fd, view[written:])
+                        if n <= 0:
+                            break
+                        written += n
+                    if written == aligned_len:
+                        os.ftruncate(fd, len(data))
+                        return
+                except OSError:
+                    pass  # e.g. EINVAL from the FS; retry buffered below
+                finally:
+                    view.release()
+                    os.close(fd)
+                    buf.close()
+
+        Path(path).write_bytes(data)
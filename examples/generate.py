@@ -19,9 +19,6 @@ import sys
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core import OutputWriter
-from src import TaskGenerator, TaskConfig
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -58,7 +55,12 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    # Imported here so --help and argument errors don't pay the heavy
+    # pydantic/numpy/PIL import cost
+    from core import OutputWriter
+    from src import TaskGenerator, TaskConfig
+
     print(f"🎲 Generating {args.num_samples} tasks...")
     
     # ──────────────────────────────────────────────────────────────────────────
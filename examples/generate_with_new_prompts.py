@@ -19,9 +19,6 @@ import sys
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core import OutputWriter
-from src import TaskGenerator, TaskConfig
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -103,7 +100,12 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    # Imported here so --help and argument errors don't pay the heavy
+    # pydantic/numpy/PIL import cost
+    from core import OutputWriter
+    from src import TaskGenerator, TaskConfig
+
     # Parse colors if provided
     dot_color = (50, 50, 200)  # Default blue
     line_color = (200, 50, 50)  # Default red
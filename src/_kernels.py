@@ -0,0 +1,53 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                     OPTIONAL NUMBA NUMERIC KERNELS                            ║
+║                                                                               ║
+║  JIT-compiled numeric loops that are not rasterization (see raster_numba).    ║
+║  Falls back silently when numba is not installed.                             ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def nearest_neighbor_order(pts, start):
+        """
+        Greedy nearest-neighbor tour over `pts` (float32, n x 2).
+
+        Returns the visit order as an int64 array starting at `start`.
+        Distances are compared squared, so no sqrt is needed.
+        """
+        n = pts.shape[0]
+        order = np.empty(n, np.int64)
+        visited = np.zeros(n, np.bool_)
+        order[0] = start
+        visited[start] = True
+        cur = start
+        for k in range(1, n):
+            best = -1
+            best_d2 = 1e30
+            for i in range(n):
+                if visited[i]:
+                    continue
+                dx = pts[i, 0] - pts[cur, 0]
+                dy = pts[i, 1] - pts[cur, 1]
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best = i
+            order[k] = best
+            visited[best] = True
+            cur = best
+        return order
+
+else:
+    nearest_neighbor_order = None
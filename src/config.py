@@ -7,7 +7,11 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
-from pydantic import Field
+import os
+from functools import cached_property
+
+import numpy as np
+from pydantic import ConfigDict, Field
 from core import GenerationConfig
 
 
@@ -25,7 +29,13 @@ class TaskConfig(GenerationConfig):
         - output_dir: Path          # Where to save outputs
         - image_size: tuple[int, int] # Image dimensions
     """
-    
+
+    # Frozen: instances are immutable and hashable, field validators run
+    # once at construction, and pickling across the worker process pool
+    # never re-validates. Derived values can safely be cached per instance.
+    model_config = ConfigDict(frozen=True)
+
+
     # ══════════════════════════════════════════════════════════════════════════
     #  OVERRIDE DEFAULTS
     # ══════════════════════════════════════════════════════════════════════════
@@ -33,6 +43,16 @@ class TaskConfig(GenerationConfig):
     domain: str = Field(default="dot_to_dot")
     image_size: tuple[int, int] = Field(default=(512, 512))
     
+    # ══════════════════════════════════════════════════════════════════════════
+    #  PERFORMANCE SETTINGS
+    # ══════════════════════════════════════════════════════════════════════════
+
+    num_workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        ge=1,
+        description="Number of worker processes for dataset generation (1 = serial)"
+    )
+
     # ══════════════════════════════════════════════════════════════════════════
     #  VIDEO SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
@@ -96,3 +116,22 @@ class TaskConfig(GenerationConfig):
         default=(255, 255, 255),
         description="Background color (RGB)"
     )
+
+    # ══════════════════════════════════════════════════════════════════════════
+    #  DERIVED VALUES (cached once per instance; the config is frozen)
+    # ══════════════════════════════════════════════════════════════════════════
+
+    @cached_property
+    def dot_color_np(self) -> np.ndarray:
+        """Dot color as a uint8 array for array-based rendering."""
+        return np.array(self.dot_color, dtype=np.uint8)
+
+    @cached_property
+    def line_color_np(self) -> np.ndarray:
+        """Line color as a uint8 array for array-based rendering."""
+        return np.array(self.line_color, dtype=np.uint8)
+
+    @cached_property
+    def background_color_np(self) -> np.ndarray:
+        """Background color as a uint8 array for array-based rendering."""
+        return np.array(self.background_color, dtype=np.uint8)
@@ -6,17 +6,78 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
-import random
+import os
 import math
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Dict
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from core import BaseGenerator, TaskPair, ImageRenderer
 from core.video_utils import VideoGenerator
 from .config import TaskConfig
 from .prompts import get_prompt
+from . import _kernels, raster_numba
+
+
+def _stamp_dots(
+    arr: "np.ndarray",
+    points: List[Tuple[int, int]],
+    mask: "np.ndarray",
+    tile: "np.ndarray",
+) -> None:
+    """
+    Stamp a precomputed dot tile at each point (masked copy).
+
+    Module-level and raw-array-only on purpose: it is the single place
+    dots reach pixels on the array path, and keeping it free of PIL and
+    instance state leaves it open to JIT compilation later.
+    """
+    r = mask.shape[0] // 2
+    height, width = arr.shape[:2]
+    for x, y in points:
+        y0, y1 = max(0, y - r), min(height, y + r + 1)
+        x0, x1 = max(0, x - r), min(width, x + r + 1)
+        ty0, tx0 = y0 - (y - r), x0 - (x - r)
+        window = mask[ty0:ty0 + (y1 - y0), tx0:tx0 + (x1 - x0)]
+        arr[y0:y1, x0:x1][window] = tile[ty0:ty0 + (y1 - y0), tx0:tx0 + (x1 - x0)][window]
+
+
+# Per-worker generator, built lazily on first job and reused for every
+# task the worker processes (the heavyweight members -- font, label
+# stamps, dot tile, video generator -- only depend on the config)
+_worker_generator = None
+
+
+def _generate_one(args: Tuple[int, TaskConfig]) -> TaskPair:
+    """
+    Generate a single task in a worker process.
+
+    Must be a module-level function so it can be pickled by
+    ProcessPoolExecutor. Each sample uses its own RNG stream derived from
+    the parent config seed, so results are reproducible regardless of how
+    samples are distributed across workers.
+    """
+    global _worker_generator
+    sample_idx, config = args
+
+    generator = _worker_generator
+    # Compare declared fields, not the models: pydantic's __eq__ compares
+    # raw __dict__s, and the cached_property ndarrays stored there make
+    # that comparison ambiguous
+    if generator is None or generator.config.model_dump() != config.model_dump():
+        generator = TaskGenerator(config)
+        _worker_generator = generator
+
+    # Line the worker's spawn counter up with the sample index so task i
+    # draws from the same SFC64 stream it would get in a serial run
+    generator._task_counter = sample_idx
+
+    task_id = f"{config.domain}_{sample_idx:04d}"
+    return generator.generate_task_pair(task_id)
 
 
 class TaskGenerator(BaseGenerator):
@@ -29,15 +90,125 @@ class TaskGenerator(BaseGenerator):
     def __init__(self, config: TaskConfig):
         super().__init__(config)
         self.renderer = ImageRenderer(image_size=config.image_size)
+
+        # Background video-encode pool (started only for serial runs, see
+        # generate_dataset): lets task i+1 render while task i encodes
+        self._encode_pool = None
+        self._encode_futures = []
+        self._encode_slots = None
+
+        # Specialized dot stamp for this config's fixed (dot_radius, colors):
+        # a boolean disc mask plus a pre-colored tile (fill + 2px outline
+        # ring), so stamping a dot is one masked copy instead of per-pixel
+        # circle tests
+        r = config.dot_radius
+        dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+        d2 = dx * dx + dy * dy
+        self._dot_mask = d2 <= r * r
+        inner = max(r - 2, 0)
+        self._dot_tile = np.empty((2 * r + 1, 2 * r + 1, 3), dtype=np.uint8)
+        self._dot_tile[:] = config.dot_color_np
+        self._dot_tile[d2 > inner * inner] = (0, 0, 0)
+
+        # RGBA view of the same tile for PIL paste paths, so every dot --
+        # arrays, stills, overlay -- has the identical pixel footprint
+        rgba = np.dstack([self._dot_tile, np.where(self._dot_mask, 255, 0).astype(np.uint8)])
+        self._dot_stamp = Image.fromarray(rgba)
+
+        # Font and label metrics are fixed for the whole run, so resolve
+        # the font file and measure every label once instead of re-statting
+        # font paths and calling textbbox per dot per frame
+        self._font = self._get_font(size=max(16, config.dot_radius * 2))
+        measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        self._label_sizes = {}
+        self._label_stamps = {}
+        for n in range(1, config.num_dots + 1):
+            text = str(n)
+            bbox = measure.textbbox((0, 0), text, font=self._font)
+            self._label_sizes[n] = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+            # Pre-rasterize the label with its outline into an RGBA stamp:
+            # the 9 draw.text calls (8 white offsets + black center) that
+            # fake the outline run once per number here instead of once
+            # per label per frame; rendering is then a single alpha paste
+            tile = Image.new('RGBA', (bbox[2] + 3, bbox[3] + 3), (0, 0, 0, 0))
+            tile_draw = ImageDraw.Draw(tile)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if dx == 0 and dy == 0:
+                        continue
+                    tile_draw.text((1 + dx, 1 + dy), text, font=self._font, fill=(255, 255, 255, 255))
+            tile_draw.text((1, 1), text, font=self._font, fill=(0, 0, 0, 255))
+            self._label_stamps[n] = tile
+
+        # Persistent line-base buffer for video generation, allocated
+        # once and cleared between tasks
+        self._line_base = None
+
+        # Per-task RNG streams: each task gets a Generator over the SFC64
+        # bit generator (faster than MT19937 and supports bulk draws),
+        # seeded from a SeedSequence child of the configured seed
+        self._seed_seq = np.random.SeedSequence(config.random_seed)
+        self._task_counter = 0
+        self._rng = np.random.Generator(np.random.SFC64(self._seed_seq))
         
         # Initialize video generator if enabled
         self.video_generator = None
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
     
+    def generate_dataset(self) -> List[TaskPair]:
+        """
+        Generate the complete dataset, fanning samples out across processes.
+
+        Each sample gets a deterministic seed (`random_seed + i`) so runs
+        are reproducible independent of worker count. Falls back to the
+        serial base implementation when only one worker is configured.
+        """
+        num_samples = self.config.num_samples
+        num_workers = min(self.config.num_workers, num_samples)
+
+        if num_workers <= 1:
+            # Serial path: overlap rendering with video encoding so the
+            # encoder latency of task i hides behind the render of task i+1
+            if self.video_generator and num_samples > 1:
+                self._start_encode_pool()
+            try:
+                return super().generate_dataset()
+            finally:
+                self._drain_encode_pool()
+
+        jobs = [(i, self.config) for i in range(num_samples)]
+        chunksize = max(1, num_samples // (4 * num_workers))
+
+        pairs = []
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            for pair in executor.map(_generate_one, jobs, chunksize=chunksize):
+                pairs.append(pair)
+                print(f"  Generated: {pair.task_id}")
+        return pairs
+
+    def _next_task_rng(self) -> "np.random.Generator":
+        """
+        Return the RNG stream for the next task.
+
+        Stream i is `SeedSequence(seed, spawn_key=(i,))`, i.e. the i-th
+        spawned child of the config seed, so a given sample index draws
+        identical values whether tasks run serially or across workers.
+        """
+        child = np.random.SeedSequence(
+            entropy=self._seed_seq.entropy,
+            spawn_key=(self._task_counter,)
+        )
+        self._task_counter += 1
+        return np.random.Generator(np.random.SFC64(child))
+
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate one dot-to-dot task pair."""
-        
+
+        # Fresh deterministic RNG stream for this task
+        self._rng = self._next_task_rng()
+
         # Generate task data (points and connection order)
         task_data = self._generate_task_data()
         
@@ -73,28 +244,59 @@ class TaskGenerator(BaseGenerator):
         
         # Generate random points with padding to avoid edges
         margin = max(self.config.dot_radius * 3, 40)
+        min_dist = margin * 1.5
+        min_dist_sq = min_dist * min_dist
         points = []
-        
+
+        # Spatial hash over accepted points: with cell size equal to the
+        # minimum separation, any conflicting point must sit in the 3x3
+        # cell neighborhood of the candidate, so each admissibility check
+        # tests O(1) points instead of scanning all accepted ones
+        grid: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+
+        def _too_close(x: int, y: int) -> bool:
+            cell_x = int(x // min_dist)
+            cell_y = int(y // min_dist)
+            for gx in (cell_x - 1, cell_x, cell_x + 1):
+                for gy in (cell_y - 1, cell_y, cell_y + 1):
+                    for px, py in grid.get((gx, gy), ()):
+                        dx = x - px
+                        dy = y - py
+                        if dx * dx + dy * dy < min_dist_sq:
+                            return True
+            return False
+
+        def _accept(x: int, y: int) -> None:
+            cell = (int(x // min_dist), int(y // min_dist))
+            grid.setdefault(cell, []).append((x, y))
+            points.append((x, y))
+
+        # One bulk draw supplies the whole candidate stream (two ints per
+        # attempt, up to 100 attempts per dot) instead of a Generator call
+        # per coordinate inside the rejection loop
+        candidates = self._rng.integers(
+            low=margin,
+            high=(width - margin + 1, height - margin + 1),
+            size=(num_dots * 100, 2),
+        )
+        cursor = 0
+
         for _ in range(num_dots):
+            placed = False
             attempts = 0
-            while attempts < 100:
-                x = random.randint(margin, width - margin)
-                y = random.randint(margin, height - margin)
-                
+            while attempts < 100 and cursor < candidates.shape[0]:
+                x = int(candidates[cursor, 0])
+                y = int(candidates[cursor, 1])
+                cursor += 1
+
                 # Check minimum distance from existing points
-                too_close = False
-                for px, py in points:
-                    dist = math.sqrt((x - px)**2 + (y - py)**2)
-                    if dist < margin * 1.5:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    points.append((x, y))
+                if not _too_close(x, y):
+                    _accept(x, y)
+                    placed = True
                     break
                 attempts += 1
-            
-            if attempts >= 100:
+
+            if not placed:
                 # Fallback: use grid layout if random placement fails
                 grid_size = int(math.ceil(math.sqrt(num_dots)))
                 idx = len(points)
@@ -102,14 +304,23 @@ class TaskGenerator(BaseGenerator):
                 col = idx % grid_size
                 x = margin + (width - 2 * margin) * col / (grid_size - 1) if grid_size > 1 else width // 2
                 y = margin + (height - 2 * margin) * row / (grid_size - 1) if grid_size > 1 else height // 2
-                points.append((int(x), int(y)))
+                _accept(int(x), int(y))
         
         # Determine connection order based on connection_type
         connection_order = self._determine_connection_order(points)
-        
+
+        # Inverse permutation: dot_number[idx] is the 1-based label of dot
+        # idx, so render loops avoid an O(n) connection_order.index scan
+        # per dot per frame; dot_labels caches the rendered strings
+        dot_number = [0] * num_dots
+        for pos, idx in enumerate(connection_order):
+            dot_number[idx] = pos + 1
+
         return {
             "points": points,
             "connection_order": connection_order,
+            "dot_number": dot_number,
+            "dot_labels": [str(n) for n in dot_number],
             "connection_type": self.config.connection_type,
             "num_dots": num_dots,
             "dot_color": self.config.dot_color,
@@ -131,9 +342,7 @@ class TaskGenerator(BaseGenerator):
         
         elif self.config.connection_type == "random":
             # Random order
-            order = list(range(num_dots))
-            random.shuffle(order)
-            return order
+            return self._rng.permutation(num_dots).tolist()
         
         else:
             # Default to sequential
@@ -144,137 +353,184 @@ class TaskGenerator(BaseGenerator):
         num_dots = len(points)
         if num_dots <= 1:
             return list(range(num_dots))
-        
+
         # Start from a random point
-        start_idx = random.randint(0, num_dots - 1)
+        start_idx = int(self._rng.integers(0, num_dots))
+
+        # Compiled greedy scan when numba is installed
+        if _kernels.NUMBA_AVAILABLE:
+            pts = np.asarray(points, dtype=np.float32)
+            return _kernels.nearest_neighbor_order(pts, start_idx).tolist()
+
+        # For a handful of dots the ufunc dispatch overhead outweighs the
+        # vectorization win, so keep a plain-Python greedy scan
+        if num_dots < 8:
+            return self._find_path_order_small(points, start_idx)
+
+        pts = np.asarray(points, dtype=np.float32)
+        unvisited = np.ones(num_dots, dtype=bool)
+        unvisited[start_idx] = False
+        order = [start_idx]
+        current_idx = start_idx
+
+        # Greedily choose nearest unvisited point; squared distances have
+        # the same argmin as real distances, so no sqrt is needed
+        for _ in range(num_dots - 1):
+            d2 = ((pts - pts[current_idx]) ** 2).sum(axis=1)
+            d2[~unvisited] = np.inf
+            current_idx = int(d2.argmin())
+            unvisited[current_idx] = False
+            order.append(current_idx)
+
+        return order
+
+    @staticmethod
+    def _find_path_order_small(points: List[Tuple[int, int]], start_idx: int) -> List[int]:
+        """Greedy nearest-neighbor scan without NumPy, for small n."""
+        num_dots = len(points)
         visited = {start_idx}
         order = [start_idx]
         current_idx = start_idx
-        
-        # Greedily choose nearest unvisited point
+
         while len(visited) < num_dots:
-            min_dist = float('inf')
+            min_dist_sq = float('inf')
             next_idx = None
-            
+            cx, cy = points[current_idx]
+
             for i in range(num_dots):
                 if i not in visited:
-                    dist = math.sqrt(
-                        (points[i][0] - points[current_idx][0])**2 +
-                        (points[i][1] - points[current_idx][1])**2
-                    )
-                    if dist < min_dist:
-                        min_dist = dist
+                    dx = points[i][0] - cx
+                    dy = points[i][1] - cy
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < min_dist_sq:
+                        min_dist_sq = dist_sq
                         next_idx = i
-            
-            if next_idx is not None:
-                order.append(next_idx)
-                visited.add(next_idx)
-                current_idx = next_idx
-            else:
-                break
-        
+
+            order.append(next_idx)
+            visited.add(next_idx)
+            current_idx = next_idx
+
         return order
     
     # ══════════════════════════════════════════════════════════════════════════
     #  IMAGE RENDERING
     # ══════════════════════════════════════════════════════════════════════════
     
-    def _render_initial_state(self, task_data: dict) -> Image.Image:
-        """Render initial state with dots only (no connections)."""
-        img = Image.new('RGB', self.config.image_size, self.config.background_color)
-        draw = ImageDraw.Draw(img)
-        
+    def _rasterize_scene(self, task_data: dict, num_segments: int) -> Image.Image:
+        """
+        Rasterize background, connection lines, and dots with the numba
+        kernel in a single compiled call (labels are drawn separately).
+        """
+        width, height = self.config.image_size
+        arr = np.empty((height, width, 3), dtype=np.uint8)
+        arr[:] = self.config.background_color_np
+
         points = task_data["points"]
         connection_order = task_data["connection_order"]
-        
-        # Draw dots
-        for idx, (x, y) in enumerate(points):
-            # Find the number label for this dot
-            dot_number = connection_order.index(idx) + 1
-            
-            # Draw dot circle
-            draw.ellipse(
-                [x - self.config.dot_radius, y - self.config.dot_radius,
-                 x + self.config.dot_radius, y + self.config.dot_radius],
-                fill=self.config.dot_color,
-                outline=(0, 0, 0),
-                width=2
-            )
-            
-            # Draw number label if enabled
-            if self.config.show_numbers:
-                font = self._get_font(size=max(16, self.config.dot_radius * 2))
-                text = str(dot_number)
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                
-                # Center text on dot
-                text_x = x - text_width // 2
-                text_y = y - text_height // 2
-                
-                # Draw text with outline for visibility
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        draw.text((text_x + dx, text_y + dy), text, font=font, fill=(255, 255, 255))
-                draw.text((text_x, text_y), text, font=font, fill=(0, 0, 0))
-        
-        return img
-    
-    def _render_final_state(self, task_data: dict) -> Image.Image:
-        """Render final state with dots connected."""
-        img = Image.new('RGB', self.config.image_size, self.config.background_color)
-        draw = ImageDraw.Draw(img)
-        
+        segments = np.empty((max(0, num_segments), 4), dtype=np.int64)
+        for i in range(segments.shape[0]):
+            x1, y1 = points[connection_order[i]]
+            x2, y2 = points[connection_order[i + 1]]
+            segments[i, 0] = x1
+            segments[i, 1] = y1
+            segments[i, 2] = x2
+            segments[i, 3] = y2
+
+        raster_numba.draw_scene(
+            arr,
+            np.empty((0, 2), dtype=np.int64),
+            self.config.dot_radius,
+            self.config.dot_color_np,
+            np.zeros(3, dtype=np.uint8),
+            segments,
+            self.config.line_width,
+            self.config.line_color_np,
+        )
+        _stamp_dots(arr, points, self._dot_mask, self._dot_tile)
+        return Image.fromarray(arr)
+
+    def _stamp_segments(self, arr: "np.ndarray", task_data: dict, num_segments: int) -> None:
+        """Write the first `num_segments` connection lines into `arr`."""
         points = task_data["points"]
         connection_order = task_data["connection_order"]
-        
-        # Draw connecting lines first (so dots appear on top)
-        for i in range(len(connection_order) - 1):
-            idx1 = connection_order[i]
-            idx2 = connection_order[i + 1]
-            x1, y1 = points[idx1]
-            x2, y2 = points[idx2]
-            
-            draw.line([(x1, y1), (x2, y2)], fill=self.config.line_color, width=self.config.line_width)
-        
-        # Draw dots on top
-        for idx, (x, y) in enumerate(points):
-            # Find the number label for this dot
-            dot_number = connection_order.index(idx) + 1
-            
-            # Draw dot circle
-            draw.ellipse(
-                [x - self.config.dot_radius, y - self.config.dot_radius,
-                 x + self.config.dot_radius, y + self.config.dot_radius],
-                fill=self.config.dot_color,
-                outline=(0, 0, 0),
-                width=2
-            )
-            
-            # Draw number label if enabled
-            if self.config.show_numbers:
-                font = self._get_font(size=max(16, self.config.dot_radius * 2))
-                text = str(dot_number)
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                
-                # Center text on dot
-                text_x = x - text_width // 2
-                text_y = y - text_height // 2
-                
-                # Draw text with outline for visibility
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        draw.text((text_x + dx, text_y + dy), text, font=font, fill=(255, 255, 255))
-                draw.text((text_x, text_y), text, font=font, fill=(0, 0, 0))
-        
+        line_color = self.config.line_color_np
+        for i in range(num_segments):
+            x1, y1 = points[connection_order[i]]
+            x2, y2 = points[connection_order[i + 1]]
+            xs, ys = self._line_pixels(x1, y1, x2, y2)
+            arr[ys, xs] = line_color
+
+    def _draw_dot(self, img: Image.Image, x: int, y: int) -> None:
+        """Paste the precomputed dot stamp centered on (x, y)."""
+        r = self.config.dot_radius
+        img.paste(self._dot_stamp, (x - r, y - r), self._dot_stamp)
+
+    def _draw_label(self, img: Image.Image, task_data: dict, idx: int, x: int, y: int) -> None:
+        """Paste the pre-rendered number label for dot `idx`, centered on (x, y)."""
+        if not self.config.show_numbers:
+            return
+        dot_number = task_data["dot_number"][idx]
+        text_width, text_height = self._label_sizes[dot_number]
+
+        # Center text on dot; the stamp already contains the white outline,
+        # so one alpha paste replaces the nine draw.text calls
+        text_x = x - text_width // 2
+        text_y = y - text_height // 2
+        stamp = self._label_stamps[dot_number]
+        if img.mode == 'RGBA':
+            # Proper over-compositing: paste would multiply the stamp's
+            # partial alpha into the layer's, dimming the outline fringe
+            # relative to stamping straight onto an RGB frame
+            img.alpha_composite(stamp, (text_x - 1, text_y - 1))
+        else:
+            img.paste(stamp, (text_x - 1, text_y - 1), stamp)
+
+    def _draw_dots_and_labels(self, img: Image.Image, task_data: dict) -> None:
+        """Draw every dot circle and its number label."""
+        for idx, (x, y) in enumerate(task_data["points"]):
+            self._draw_dot(img, x, y)
+            self._draw_label(img, task_data, idx, x, y)
+
+    def _render_dots_overlay(self, task_data: dict) -> Image.Image:
+        """
+        Render all dots and labels once into a transparent RGBA layer.
+
+        Dots and labels are static for the whole animation; compositing
+        this overlay replaces re-drawing num_dots ellipses and label
+        stamps for every connection base.
+        """
+        overlay = Image.new('RGBA', self.config.image_size, (0, 0, 0, 0))
+        self._draw_dots_and_labels(overlay, task_data)
+        return overlay
+
+    def _render_scene(self, task_data: dict, num_segments: int) -> Image.Image:
+        """Render the first `num_segments` connections plus all dots and labels."""
+        if raster_numba.NUMBA_AVAILABLE:
+            # Lines and dot circles come out of the compiled rasterizer;
+            # only the text labels still go through PIL
+            img = self._rasterize_scene(task_data, num_segments)
+            for idx, (x, y) in enumerate(task_data["points"]):
+                self._draw_label(img, task_data, idx, x, y)
+        else:
+            # Lines first so dots appear on top; stamped with the same
+            # square brush as the animation so line thickness never
+            # changes between animated, completed, and still frames
+            width, height = self.config.image_size
+            arr = np.empty((height, width, 3), dtype=np.uint8)
+            arr[:] = self.config.background_color_np
+            self._stamp_segments(arr, task_data, num_segments)
+            img = Image.fromarray(arr)
+            self._draw_dots_and_labels(img, task_data)
         return img
+
+    def _render_initial_state(self, task_data: dict) -> Image.Image:
+        """Render initial state with dots only (no connections)."""
+        return self._render_scene(task_data, num_segments=0)
+
+    def _render_final_state(self, task_data: dict) -> Image.Image:
+        """Render final state with dots connected."""
+        num_segments = len(task_data["connection_order"]) - 1
+        return self._render_scene(task_data, num_segments=num_segments)
     
     def _get_font(self, size: int = 20) -> ImageFont.FreeTypeFont:
         """Get a font for rendering numbers."""
@@ -314,124 +570,225 @@ class TaskGenerator(BaseGenerator):
         temp_dir.mkdir(parents=True, exist_ok=True)
         video_path = temp_dir / f"{task_id}_ground_truth.mp4"
         
-        # Create animation frames
-        frames = self._create_connection_animation_frames(task_data)
-        
-        result = self.video_generator.create_video_from_frames(
-            frames,
-            video_path
+        # Animation frames are produced lazily; the synchronous path
+        # streams them straight into the encoder one at a time
+        frames = self._iter_connection_animation_frames(
+            task_data,
+            initial_frame=first_image,
+            final_frame=final_image,
         )
-        
+
+        if self._encode_pool is not None:
+            # Rendering must stay on this thread (the frame generator uses
+            # per-generator scratch state), so materialize before handing
+            # the encode off. Bound in-flight jobs so pending frame lists
+            # cannot pile up
+            frame_list = list(frames)
+            self._encode_slots.acquire()
+            future = self._encode_pool.submit(self._encode_frames, frame_list, video_path)
+            future.add_done_callback(lambda _: self._encode_slots.release())
+            self._encode_futures.append(future)
+            return str(video_path)
+
+        result = self._encode_frames(frames, video_path)
         return str(result) if result else None
+
+    def _encode_frames(self, frames, video_path: Path):
+        """
+        Encode frames to a video file.
+
+        The stream holds fromarray snapshots plus the task's own
+        first/final images; nothing here may be recycled or mutated,
+        since the writer has not saved the task's images yet.
+        """
+        return self.video_generator.create_video_from_frames(frames, video_path)
+
+    def _start_encode_pool(self) -> None:
+        """Start the bounded background pool for overlapping video encodes."""
+        num_encoders = max(1, (os.cpu_count() or 2) // 2)
+        self._encode_pool = ThreadPoolExecutor(max_workers=num_encoders)
+        self._encode_slots = threading.BoundedSemaphore(2 * num_encoders)
+        self._encode_futures = []
+
+    def _drain_encode_pool(self) -> None:
+        """Wait for all pending encodes and shut the pool down."""
+        if self._encode_pool is None:
+            return
+        try:
+            for future in self._encode_futures:
+                future.result()
+        finally:
+            self._encode_pool.shutdown(wait=True)
+            self._encode_pool = None
+            self._encode_slots = None
+            self._encode_futures = []
     
-    def _create_connection_animation_frames(
+    def _iter_connection_animation_frames(
         self,
         task_data: dict,
         hold_frames: int = 5,
-        transition_frames_per_connection: int = 15
-    ) -> List[Image.Image]:
+        transition_frames_per_connection: int = 15,
+        initial_frame: Image.Image = None,
+        final_frame: Image.Image = None
+    ):
         """
-        Create animation frames showing dots being connected sequentially.
-        
-        Each connection is animated smoothly over multiple frames.
+        Yield animation frames showing dots being connected sequentially.
+
+        Each connection is animated smoothly over multiple frames. Frames
+        are generated lazily so a consumer that encodes as it reads never
+        holds more than one frame (plus the scene bases) in memory.
         """
-        frames = []
         points = task_data["points"]
         connection_order = task_data["connection_order"]
-        
-        # Hold initial state
-        initial_frame = self._render_initial_state(task_data)
+
+        # Hold initial state. The encoder only reads frames, so the hold
+        # phases repeat one shared image instead of allocating copies --
+        # the stream never contains pool-owned canvases, so nothing needs
+        # to be reclaimed afterwards. The caller passes its already-
+        # rendered first/final images when it has them so neither state
+        # is rendered twice per task
+        if initial_frame is None:
+            initial_frame = self._render_initial_state(task_data)
         for _ in range(hold_frames):
-            frames.append(initial_frame.copy())
-        
+            yield initial_frame
+
+        # Completed connections are stamped into this base exactly once,
+        # with the same square brush as the animated segment and the
+        # rasterized stills, so line thickness is stable across the whole
+        # stream; every animation frame then starts from a copy of the
+        # base instead of redrawing all previous segments from scratch.
+        # The buffer itself persists across tasks and is just cleared.
+        width, height = self.config.image_size
+        if self._line_base is None or self._line_base.shape[:2] != (height, width):
+            self._line_base = np.empty((height, width, 3), dtype=np.uint8)
+        line_base = self._line_base
+        line_base[:] = self.config.background_color_np
+
+        # Static layer shared by every connection of this task: the dots
+        # and labels never move during the animation. Its alpha channel
+        # doubles as the mask of pixels the animated line must not touch
+        # (any dot or label it crosses, not just its own endpoints)
+        dots_overlay = self._render_dots_overlay(task_data)
+        dots_mask = np.asarray(dots_overlay)[:, :, 3] > 0
+
         # Animate each connection
         for connection_idx in range(len(connection_order) - 1):
             idx1 = connection_order[connection_idx]
             idx2 = connection_order[connection_idx + 1]
-            
+
             # Create frames for this connection
-            connection_frames = self._animate_single_connection(
+            yield from self._animate_single_connection(
                 task_data,
-                connection_idx + 1,  # Number of connections completed so far
+                line_base,
+                dots_overlay,
+                dots_mask,
                 idx1,
                 idx2,
                 transition_frames_per_connection
             )
-            frames.extend(connection_frames)
-        
-        # Hold final state
-        final_frame = self._render_final_state(task_data)
+
+            # Stamp the finished segment into the base for later frames
+            # (same brush pixels the animation just finished writing)
+            xs, ys = self._line_pixels(points[idx1][0], points[idx1][1],
+                                       points[idx2][0], points[idx2][1])
+            line_base[ys, xs] = self.config.line_color_np
+
+        # Hold final state (shared reference, as above)
+        if final_frame is None:
+            final_frame = self._render_final_state(task_data)
         for _ in range(hold_frames):
-            frames.append(final_frame.copy())
-        
-        return frames
+            yield final_frame
     
     def _animate_single_connection(
         self,
         task_data: dict,
-        num_connections_completed: int,
+        line_base: "np.ndarray",
+        dots_overlay: Image.Image,
+        dots_mask: "np.ndarray",
         from_idx: int,
         to_idx: int,
         num_frames: int
-    ) -> List[Image.Image]:
-        """Animate drawing a single line between two dots."""
-        frames = []
+    ):
+        """
+        Yield frames animating a single line between two dots.
+
+        `line_base` already contains every completed connection and
+        `dots_overlay` the static dots+labels layer, so composing the
+        per-connection base is one copy plus one paste. The base is held
+        as a NumPy array and the growing partial line is written as
+        per-frame pixel diffs: frame i only touches the line pixels that
+        appeared since frame i-1 instead of redrawing anything, so the
+        per-frame cost is O(new line pixels) rather than O(W*H).
+        """
         points = task_data["points"]
-        connection_order = task_data["connection_order"]
-        
+
         x1, y1 = points[from_idx]
         x2, y2 = points[to_idx]
-        
-        for i in range(num_frames):
-            progress = i / (num_frames - 1) if num_frames > 1 else 1.0
-            
-            # Create frame
-            img = Image.new('RGB', self.config.image_size, self.config.background_color)
-            draw = ImageDraw.Draw(img)
-            
-            # Draw all completed connections
-            for conn_idx in range(num_connections_completed):
-                if conn_idx < len(connection_order) - 1:
-                    cidx1 = connection_order[conn_idx]
-                    cidx2 = connection_order[conn_idx + 1]
-                    cx1, cy1 = points[cidx1]
-                    cx2, cy2 = points[cidx2]
-                    draw.line([(cx1, cy1), (cx2, cy2)], fill=self.config.line_color, width=self.config.line_width)
-            
-            # Draw current connection (partially)
-            if progress > 0:
-                current_x = x1 + (x2 - x1) * progress
-                current_y = y1 + (y2 - y1) * progress
-                draw.line([(x1, y1), (current_x, current_y)], fill=self.config.line_color, width=self.config.line_width)
-            
-            # Draw all dots
-            for idx, (x, y) in enumerate(points):
-                dot_number = connection_order.index(idx) + 1
-                
-                draw.ellipse(
-                    [x - self.config.dot_radius, y - self.config.dot_radius,
-                     x + self.config.dot_radius, y + self.config.dot_radius],
-                    fill=self.config.dot_color,
-                    outline=(0, 0, 0),
-                    width=2
-                )
-                
-                if self.config.show_numbers:
-                    font = self._get_font(size=max(16, self.config.dot_radius * 2))
-                    text = str(dot_number)
-                    bbox = draw.textbbox((0, 0), text, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                    text_x = x - text_width // 2
-                    text_y = y - text_height // 2
-                    
-                    for dx in (-1, 0, 1):
-                        for dy in (-1, 0, 1):
-                            if dx == 0 and dy == 0:
-                                continue
-                            draw.text((text_x + dx, text_y + dy), text, font=font, fill=(255, 255, 255))
-                    draw.text((text_x, text_y), text, font=font, fill=(0, 0, 0))
-            
-            frames.append(img)
-        
-        return frames
+
+        # Per-connection scene base: completed lines + static dots layer
+        base = Image.fromarray(line_base)
+        base.paste(dots_overlay, (0, 0), dots_overlay)
+
+        # Pixel coordinates of the full segment, in draw order; pixels
+        # under any dot or label (the overlay's alpha footprint) are
+        # dropped up front so the line stays visually beneath every dot
+        # it crosses without any redraw
+        xs, ys = self._line_pixels(x1, y1, x2, y2, blocked=dots_mask)
+        num_pixels = len(xs)
+
+        scratch = np.array(base, dtype=np.uint8)
+        line_color = self.config.line_color_np
+        written = 0
+
+        # Per-frame prefix lengths in one vectorized pass: integer pixel
+        # counts replace the per-frame progress divide and float rounding
+        counts = np.rint(np.linspace(0.0, num_pixels, num_frames)).astype(np.intp)
+        if num_frames == 1:
+            counts[0] = num_pixels
+
+        for count in counts:
+            # Extend the partial line by writing only the new pixels
+            if count > written:
+                scratch[ys[written:count], xs[written:count]] = line_color
+                written = count
+
+            # fromarray copies for RGB input, so the snapshot is safe to
+            # hand out while scratch keeps mutating
+            yield Image.fromarray(scratch)
+
+    def _line_pixels(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        blocked: "np.ndarray" = None
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Precompute the pixel coordinates of a thick line segment.
+
+        Returns (xs, ys) index arrays ordered from (x1, y1) to (x2, y2),
+        using the same stepped square brush as the numba rasterizer and
+        clipped to the canvas. `blocked` is an optional (H, W) bool mask
+        of pixels the line must leave alone (the dots+labels overlay
+        footprint, so lines pass beneath every dot and label they cross).
+        """
+        steps = max(abs(x2 - x1), abs(y2 - y1)) + 1
+        t = np.linspace(0.0, 1.0, steps)
+        cx = np.rint(x1 + (x2 - x1) * t).astype(np.intp)
+        cy = np.rint(y1 + (y2 - y1) * t).astype(np.intp)
+
+        line_width = self.config.line_width
+        half = line_width // 2
+        offsets = np.arange(-half, line_width - half)
+        ox, oy = np.meshgrid(offsets, offsets)
+        xs = (cx[:, None] + ox.ravel()[None, :]).ravel()
+        ys = (cy[:, None] + oy.ravel()[None, :]).ravel()
+
+        width, height = self.config.image_size
+        keep = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        xs, ys = xs[keep], ys[keep]
+        if blocked is not None:
+            open_px = ~blocked[ys, xs]
+            xs, ys = xs[open_px], ys[open_px]
+        return xs, ys
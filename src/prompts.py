@@ -6,6 +6,7 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
 import random
 
 
@@ -13,8 +14,22 @@ import random
 #  DOT-TO-DOT PROMPTS
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Exact names for the colors the configs actually produce; anything else
+# falls through to the range tests below
+_COLOR_TABLE = {
+    (50, 50, 200): "blue",
+    (200, 50, 50): "red",
+    (255, 255, 255): "white",
+    (0, 0, 0): "black",
+}
+
+
+@functools.lru_cache(maxsize=64)
 def _get_color_description(rgb: tuple[int, int, int]) -> str:
     """Convert RGB tuple to color description."""
+    name = _COLOR_TABLE.get(rgb)
+    if name is not None:
+        return name
     r, g, b = rgb
     if r < 100 and g < 100 and b > 150:
         return "blue"
@@ -28,82 +43,100 @@ def _get_color_description(rgb: tuple[int, int, int]) -> str:
         return f"RGB({r}, {g}, {b})"
 
 
+# Prompt templates are built once at import time; get_prompt only fills in
+# the per-task values instead of re-assembling the full string per call
+_PROMPT_SEQUENTIAL = (
+    "The scene shows {num_dots} circular objects (dots) scattered across a white background. "
+    "Each object is a filled {dot_color} circle with a black outline. "
+    "Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
+    "Starting from dot 1, draw straight lines connecting the dots in strict numerical order: "
+    "first draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing sequentially "
+    "until you reach dot {num_dots}. Each line should be drawn as a {line_color} straight line segment "
+    "connecting the centers of the two consecutive numbered dots. "
+    "Continue this process until all {num_dots} dots are connected in numerical sequence, "
+    "forming a continuous path from dot 1 to dot {num_dots}."
+)
+
+_PROMPT_PATH = (
+    "The scene shows {num_dots} circular objects (dots) scattered across a white background. "
+    "Each object is a filled {dot_color} circle with a black outline. "
+    "Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
+    "The numbers indicate the order in which the dots should be visited. "
+    "Starting from dot 1, draw straight lines connecting the dots following the numbered sequence: "
+    "draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing in order "
+    "until you reach dot {num_dots}. Each line should be drawn as a {line_color} straight line segment "
+    "connecting the centers of the two consecutive numbered dots. "
+    "Continue this process until all {num_dots} dots are connected following the numbered sequence, "
+    "forming a complete continuous path that visits each dot exactly once in the order indicated by their numbers."
+)
+
+_PROMPT_RANDOM = (
+    "The scene shows {num_dots} circular objects (dots) scattered across a white background. "
+    "Each object is a filled {dot_color} circle with a black outline. "
+    "Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
+    "Starting from dot 1, draw straight lines connecting the dots in the order indicated by their numbers: "
+    "draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing in the numbered sequence "
+    "until you reach dot {num_dots}. Each line should be drawn as a {line_color} straight line segment "
+    "connecting the centers of the two consecutive numbered dots. "
+    "Continue this process until all {num_dots} dots are connected following the numbered order, "
+    "forming a continuous path from dot 1 to dot {num_dots}."
+)
+
+_PROMPT_DEFAULT = (
+    "The scene shows {num_dots} circular objects (dots) scattered across a white background. "
+    "Each object is a filled {dot_color} circle with a black outline. "
+    "Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
+    "Starting from dot 1, systematically connect all the dots by drawing straight lines between them in numerical order. "
+    "Draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing sequentially "
+    "until you reach dot {num_dots}. Each line should be drawn as a {line_color} straight line segment "
+    "connecting the centers of the two consecutive numbered dots. "
+    "Ensure that each dot is connected exactly once in the sequence, and continue this process "
+    "until all {num_dots} dots are connected in numerical order, forming a complete continuous path "
+    "from the first dot to the last dot."
+)
+
+_PROMPT_TEMPLATES = {
+    "sequential": _PROMPT_SEQUENTIAL,
+    "path": _PROMPT_PATH,
+    "random": _PROMPT_RANDOM,
+}
+
+
 def get_prompt(task_data: dict = None, task_type: str = "default") -> str:
     """
     Generate a detailed prompt for the dot-to-dot task.
-    
+
     Args:
         task_data: Dictionary containing task information (num_dots, connection_type, etc.)
         task_type: Type of task (key in PROMPTS dict) - kept for backward compatibility
-        
+
     Returns:
         Detailed prompt string
     """
     if task_data is None:
         task_data = {}
-    
+
     num_dots = task_data.get("num_dots", 5)
     connection_type = task_data.get("connection_type", task_type)
-    
+
     # Get color descriptions
     dot_color = task_data.get("dot_color", (50, 50, 200))
     line_color = task_data.get("line_color", (200, 50, 50))
     dot_color_desc = _get_color_description(dot_color)
     line_color_desc = _get_color_description(line_color)
-    
-    # Base prompt template following the reference format
-    if connection_type == "sequential":
-        prompt = (
-            f"The scene shows {num_dots} circular objects (dots) scattered across a white background. "
-            f"Each object is a filled {dot_color_desc} circle with a black outline. "
-            f"Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
-            f"Starting from dot 1, draw straight lines connecting the dots in strict numerical order: "
-            f"first draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing sequentially "
-            f"until you reach dot {num_dots}. Each line should be drawn as a {line_color_desc} straight line segment "
-            f"connecting the centers of the two consecutive numbered dots. "
-            f"Continue this process until all {num_dots} dots are connected in numerical sequence, "
-            f"forming a continuous path from dot 1 to dot {num_dots}."
-        )
-    elif connection_type == "path":
-        prompt = (
-            f"The scene shows {num_dots} circular objects (dots) scattered across a white background. "
-            f"Each object is a filled {dot_color_desc} circle with a black outline. "
-            f"Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
-            f"The numbers indicate the order in which the dots should be visited. "
-            f"Starting from dot 1, draw straight lines connecting the dots following the numbered sequence: "
-            f"draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing in order "
-            f"until you reach dot {num_dots}. Each line should be drawn as a {line_color_desc} straight line segment "
-            f"connecting the centers of the two consecutive numbered dots. "
-            f"Continue this process until all {num_dots} dots are connected following the numbered sequence, "
-            f"forming a complete continuous path that visits each dot exactly once in the order indicated by their numbers."
-        )
-    elif connection_type == "random":
-        prompt = (
-            f"The scene shows {num_dots} circular objects (dots) scattered across a white background. "
-            f"Each object is a filled {dot_color_desc} circle with a black outline. "
-            f"Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
-            f"Starting from dot 1, draw straight lines connecting the dots in the order indicated by their numbers: "
-            f"draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing in the numbered sequence "
-            f"until you reach dot {num_dots}. Each line should be drawn as a {line_color_desc} straight line segment "
-            f"connecting the centers of the two consecutive numbered dots. "
-            f"Continue this process until all {num_dots} dots are connected following the numbered order, "
-            f"forming a continuous path from dot 1 to dot {num_dots}."
-        )
-    else:  # default
-        prompt = (
-            f"The scene shows {num_dots} circular objects (dots) scattered across a white background. "
-            f"Each object is a filled {dot_color_desc} circle with a black outline. "
-            f"Each circle is labeled with a number from 1 to {num_dots}, displayed in black text centered on the circle. "
-            f"Starting from dot 1, systematically connect all the dots by drawing straight lines between them in numerical order. "
-            f"Draw a line from dot 1 to dot 2, then from dot 2 to dot 3, continuing sequentially "
-            f"until you reach dot {num_dots}. Each line should be drawn as a {line_color_desc} straight line segment "
-            f"connecting the centers of the two consecutive numbered dots. "
-            f"Ensure that each dot is connected exactly once in the sequence, and continue this process "
-            f"until all {num_dots} dots are connected in numerical order, forming a complete continuous path "
-            f"from the first dot to the last dot."
-        )
-    
-    return prompt
+
+    return _format_prompt(connection_type, num_dots, dot_color_desc, line_color_desc)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_prompt(connection_type: str, num_dots: int, dot_color: str, line_color: str) -> str:
+    """Fill a prompt template; cached since most tasks in a run share parameters."""
+    template = _PROMPT_TEMPLATES.get(connection_type, _PROMPT_DEFAULT)
+    return template.format(
+        num_dots=num_dots,
+        dot_color=dot_color,
+        line_color=line_color,
+    )
 
 
 def get_all_prompts(task_type: str = "default") -> list[str]:
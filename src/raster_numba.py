@@ -0,0 +1,97 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                     OPTIONAL NUMBA SCENE RASTERIZER                           ║
+║                                                                               ║
+║  JIT-compiled dot/line rasterization for the rendering hot loop.              ║
+║  Falls back silently when numba is not installed.                             ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+PIL's per-primitive draw calls go through Python-level dispatch for every
+ellipse and line segment; with video generation each task renders hundreds
+of frames. `draw_scene` rasterizes all line segments and dots of a frame
+directly into a uint8 (H, W, 3) array in one compiled call.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True, fastmath=True, boundscheck=False)
+    def draw_scene(img, dots_xy, dot_radius, dot_rgb, outline_rgb, segments, line_width, line_rgb):
+        """
+        Rasterize line segments and dots into `img` (uint8, H x W x 3).
+
+        Lines are drawn first so dots appear on top, matching the PIL
+        rendering order. Dots get a 2px inner outline ring like
+        `ImageDraw.ellipse(..., outline=..., width=2)`.
+
+        Args:
+            img: Target canvas, modified in place
+            dots_xy: (N, 2) int array of dot centers
+            dot_radius: Dot radius in pixels
+            dot_rgb / outline_rgb / line_rgb: (3,) uint8 color arrays
+            segments: (M, 4) int array of (x0, y0, x1, y1) line segments
+            line_width: Line width in pixels
+        """
+        height = img.shape[0]
+        width = img.shape[1]
+
+        # Line segments (square brush stepped along the segment)
+        half = line_width // 2
+        for s in prange(segments.shape[0]):
+            x0 = segments[s, 0]
+            y0 = segments[s, 1]
+            x1 = segments[s, 2]
+            y1 = segments[s, 3]
+            steps = max(abs(x1 - x0), abs(y1 - y0)) + 1
+            for t in range(steps):
+                frac = t / (steps - 1) if steps > 1 else 0.0
+                px = int(round(x0 + (x1 - x0) * frac))
+                py = int(round(y0 + (y1 - y0) * frac))
+                for dy in range(-half, line_width - half):
+                    yy = py + dy
+                    if yy < 0 or yy >= height:
+                        continue
+                    for dx in range(-half, line_width - half):
+                        xx = px + dx
+                        if xx < 0 or xx >= width:
+                            continue
+                        img[yy, xx, 0] = line_rgb[0]
+                        img[yy, xx, 1] = line_rgb[1]
+                        img[yy, xx, 2] = line_rgb[2]
+
+        # Dots (filled circle with inner outline ring, drawn on top)
+        r2 = dot_radius * dot_radius
+        inner = dot_radius - 2
+        inner2 = inner * inner if inner > 0 else 0
+        for d in prange(dots_xy.shape[0]):
+            cx = dots_xy[d, 0]
+            cy = dots_xy[d, 1]
+            for dy in range(-dot_radius, dot_radius + 1):
+                yy = cy + dy
+                if yy < 0 or yy >= height:
+                    continue
+                for dx in range(-dot_radius, dot_radius + 1):
+                    xx = cx + dx
+                    if xx < 0 or xx >= width:
+                        continue
+                    d2 = dx * dx + dy * dy
+                    if d2 <= r2:
+                        if d2 > inner2:
+                            img[yy, xx, 0] = outline_rgb[0]
+                            img[yy, xx, 1] = outline_rgb[1]
+                            img[yy, xx, 2] = outline_rgb[2]
+                        else:
+                            img[yy, xx, 0] = dot_rgb[0]
+                            img[yy, xx, 1] = dot_rgb[1]
+                            img[yy, xx, 2] = dot_rgb[2]
+
+else:
+    draw_scene = None
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Warm the numba JIT cache ahead of first use.
+
+The rasterizer kernels are decorated with @njit(cache=True), so compiled
+machine code persists next to the source in __pycache__. First-call
+compilation still takes a second or two, which dominates short example
+runs; invoke this once after install (or in CI image builds) so real runs
+always hit the cache.
+
+Usage:
+    python tools/precompile_kernels.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def main():
+    from src import _kernels, raster_numba
+
+    if not raster_numba.NUMBA_AVAILABLE:
+        print("numba is not installed; nothing to precompile.")
+        return
+
+    import numpy as np
+
+    # Call each kernel once with representative dtypes to trigger
+    # compilation (and populate the on-disk cache)
+    img = np.zeros((32, 32, 3), dtype=np.uint8)
+    dots = np.array([[16, 16]], dtype=np.int64)
+    segments = np.array([[2, 2, 30, 30]], dtype=np.int64)
+    color = np.zeros(3, dtype=np.uint8)
+    pts = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 0.0]], dtype=np.float32)
+
+    start = time.perf_counter()
+    raster_numba.draw_scene(img, dots, 4, color, color, segments, 3, color)
+    _kernels.nearest_neighbor_order(pts, 0)
+    print(f"Kernels compiled and cached in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()